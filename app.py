@@ -1,9 +1,26 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+from collections import deque
 from datetime import datetime
+import io
+import orjson
+import os
+import polars as pl
+import pyarrow as pa
+import pyarrow.json as pajson
 import requests
+import tempfile
+import threading
+import time
+from requests.adapters import HTTPAdapter, Retry
+
+# Serialize figures with orjson — C-level encoding of NumPy buffers instead
+# of Plotly's recursive pure-Python walk
+pio.json.config.default_engine = "orjson"
 
 # Page config (must be first)
 st.set_page_config(
@@ -12,51 +29,169 @@ st.set_page_config(
     layout="wide"
 )
 
+# Pooled HTTP session so repeat API fetches reuse keep-alive connections
+# instead of paying a TCP+TLS handshake per call
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
 # Initialize session state
 st.session_state.setdefault("df", None)
 st.session_state.setdefault("data_source", None)
 st.session_state.setdefault("uploaded_filename", None)
+st.session_state.setdefault("xlsx_bytes", None)
+st.session_state.setdefault("df_shape", None)
+st.session_state.setdefault("csv_path", None)
 
 
-@st.cache_data(show_spinner=False)
-def load_csv(file) -> pd.DataFrame:
-    """Load CSV file with caching."""
-    return pd.read_csv(file)
+def _shrink(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns and categorize low-cardinality string columns.
 
+    Narrower buffers cut the memory bandwidth of every downstream scan
+    (describe, corr, isna, chart data), and category columns make
+    filter/unique operations O(categories) instead of O(rows).
+    """
+    for c in df.select_dtypes('integer').columns:
+        df[c] = pd.to_numeric(df[c], downcast='integer')
+    for c in df.select_dtypes('float').columns:
+        df[c] = pd.to_numeric(df[c], downcast='float')
+    if len(df) > 0:
+        for c in df.columns:
+            if (df[c].dtype == object or pd.api.types.is_string_dtype(df[c])) \
+                    and df[c].nunique() / len(df) < 0.5:
+                df[c] = df[c].astype('category')
+    return df
 
-@st.cache_data(show_spinner=False)
+
+@st.cache_resource(show_spinner=False)
+def _spooled_csv_paths() -> deque:
+    """Registry of spooled CSV paths, shared across reruns and sessions."""
+    return deque()
+
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def persist_csv(file) -> str:
+    """Spool an uploaded CSV to a temp file so Polars can re-scan it lazily.
+
+    Only the two most recent spools are kept on disk, mirroring load_csv's
+    cache bound; older files are unlinked as new uploads arrive.
+    """
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".csv", delete=False) as tmp:
+        tmp.write(file.getbuffer())
+        path = tmp.name
+
+    paths = _spooled_csv_paths()
+    paths.append(path)
+    while len(paths) > 2:
+        stale = paths.popleft()
+        try:
+            os.unlink(stale)
+        except OSError:
+            pass
+    return path
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def scan_csv(path: str) -> pl.LazyFrame:
+    """Lazy scan over the spooled CSV — selects and filters applied to this
+    plan push down into the reader, so only the needed columns/rows are parsed."""
+    return pl.scan_csv(path)
+
+
+# max_entries=2 keeps the current and previous upload at most; without a
+# bound, a sequence of large uploads accretes in the cache until OOM
+@st.cache_data(show_spinner=False, max_entries=2, ttl=24 * 3600)
+def load_csv(path: str) -> pd.DataFrame:
+    """Materialize the scanned CSV with caching (streaming collect, Arrow dtypes)."""
+    df = scan_csv(path).collect(engine="streaming").to_pandas(use_pyarrow_extension_array=True)
+    return _shrink(df)
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
 def load_snowflake_data(query: str) -> pd.DataFrame:
-    """Load data from Snowflake with caching."""
+    """Load data from Snowflake with caching (streamed as Arrow batches)."""
     try:
-        from snowflake.snowpark import Session
-        session = Session.builder.configs(
-            st.secrets["connections"]["snowflake"]
-        ).create()
-        df = session.sql(query).to_pandas()
-        return df
+        import snowflake.connector
+        conn = snowflake.connector.connect(
+            **st.secrets["connections"]["snowflake"]
+        )
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            batches = list(cursor.fetch_arrow_batches())
+        finally:
+            conn.close()
+
+        if not batches:
+            return pd.DataFrame()
+
+        table = pa.concat_tables(batches)
+        df = table.to_pandas(
+            types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True
+        )
+        return _shrink(df)
     except Exception as e:
         st.error(f"Snowflake connection error: {e}")
         return None
 
 
-@st.cache_data(show_spinner=False, ttl=3600)
+API_TTL_SECONDS = 3600
+
+
+def _request_api_data(endpoint: str) -> pd.DataFrame:
+    """Fetch and parse an API payload into a DataFrame (raises on HTTP errors)."""
+    response = _session.get(endpoint, timeout=30)
+    response.raise_for_status()
+
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as decode_error:
+        # Not a single JSON document — newline-delimited JSON streams parse
+        # straight to Arrow with the SIMD reader, no Python objects created
+        try:
+            table = pajson.read_json(io.BytesIO(response.content))
+        except (pa.ArrowInvalid, ValueError):
+            # Neither JSON nor NDJSON (HTML error page, plain text, ...) —
+            # raise the same error family as baseline response.json() so the
+            # callers' RequestException handlers turn it into st.error
+            raise requests.exceptions.JSONDecodeError(
+                decode_error.msg, str(response.content[:200]), decode_error.pos
+            ) from decode_error
+        return _shrink(table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True))
+
+    # Handle different response formats
+    if isinstance(data, dict):
+        # Try common data keys
+        for key in ['data', 'results', 'items', 'records']:
+            if key in data:
+                data = data[key]
+                break
+        else:
+            data = [data]
+    if isinstance(data, dict):
+        # Column-oriented payload ({"col1": [...], "col2": [...]}) unwrapped
+        # from a data key — build the frame from the dict of lists directly
+        return _shrink(pd.DataFrame(data))
+    if isinstance(data, list):
+        if data and all(isinstance(row, dict) for row in data):
+            # Row dicts go through Arrow rather than the pandas dict-of-lists
+            # conversion, yielding Arrow-backed columns without an extra copy
+            table = pa.Table.from_pylist(data)
+            return _shrink(table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True))
+        return _shrink(pd.DataFrame(data))
+    return pd.DataFrame()
+
+
+@st.cache_data(show_spinner=False, ttl=API_TTL_SECONDS)
 def fetch_api_data(endpoint: str) -> pd.DataFrame:
     """Fetch data from API with caching (1 hour TTL)."""
     try:
-        response = requests.get(endpoint, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Handle different response formats
-        if isinstance(data, list):
-            return pd.DataFrame(data)
-        elif isinstance(data, dict):
-            # Try common data keys
-            for key in ['data', 'results', 'items', 'records']:
-                if key in data:
-                    return pd.DataFrame(data[key])
-            return pd.DataFrame([data])
-        return pd.DataFrame()
+        return _request_api_data(endpoint)
     except requests.exceptions.Timeout:
         st.error("API request timed out. Please try again.")
         return None
@@ -65,6 +200,143 @@ def fetch_api_data(endpoint: str) -> pd.DataFrame:
         return None
 
 
+def _refresh_api_data(endpoint: str, store: dict) -> None:
+    """Background worker: re-fetch an endpoint and swap the result into the store."""
+    try:
+        store[endpoint] = (_request_api_data(endpoint), time.monotonic())
+    except (requests.exceptions.RequestException, ValueError):
+        # ValueError covers the parse-error family (orjson.JSONDecodeError,
+        # pyarrow ArrowInvalid); keep serving the stale frame and let the
+        # next expiry retry
+        pass
+    finally:
+        store.pop(("refreshing", endpoint), None)
+
+
+def get_api_data(endpoint: str) -> pd.DataFrame:
+    """Return API data immediately, refreshing stale entries in the background.
+
+    Stale-while-revalidate: once the TTL expires, the stale frame is served
+    synchronously while a daemon thread re-fetches, so no rerun ever blocks
+    on the full API round-trip after the first load.
+    """
+    store = st.session_state.setdefault("api_store", {})
+    entry = store.get(endpoint)
+
+    if entry is None:
+        df = fetch_api_data(endpoint)
+        if df is not None:
+            store[endpoint] = (df, time.monotonic())
+        return df
+
+    df, fetched_at = entry
+    if (time.monotonic() - fetched_at > API_TTL_SECONDS
+            and ("refreshing", endpoint) not in store):
+        store[("refreshing", endpoint)] = True
+        threading.Thread(
+            target=_refresh_api_data, args=(endpoint, store), daemon=True
+        ).start()
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def build_csv(df: pd.DataFrame) -> str:
+    """Serialize the DataFrame to CSV once per cached frame."""
+    return df.to_csv(index=False)
+
+
+@st.cache_data(show_spinner="Building Excel workbook...")
+def build_xlsx(df: pd.DataFrame) -> bytes:
+    """Serialize the DataFrame to an Excel workbook once per cached frame.
+
+    xlsxwriter streams shared strings and formatting far leaner than
+    openpyxl's per-cell objects. Its constant_memory mode is deliberately
+    not used: it drops the out-of-order (column-by-column) writes that
+    pandas' to_excel produces, corrupting the workbook.
+    """
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='Data', index=False)
+        xlsx_numeric_cols = get_numeric_columns(df)
+        if len(xlsx_numeric_cols) > 0:
+            df[xlsx_numeric_cols].describe().to_excel(writer, sheet_name='Statistics')
+    return output.getvalue()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _lazy_from_pandas(df: pd.DataFrame) -> pl.LazyFrame:
+    """Wrap the DataFrame in a Polars LazyFrame (zero-copy for Arrow-backed frames)."""
+    return pl.from_pandas(df).lazy()
+
+
+def to_lazy(df: pd.DataFrame) -> pl.LazyFrame:
+    """LazyFrame over the current data.
+
+    CSV uploads re-scan the spooled file so projection/predicate pushdown
+    reaches the reader itself rather than an in-memory copy. Dispatch is
+    per-call and checks that the file still exists — spool files are
+    unlinked as new uploads arrive (possibly from another session), and a
+    cached plan over a deleted path would fail on collect — falling back
+    to the in-memory frame when the path is gone.
+    """
+    path = st.session_state.csv_path
+    if st.session_state.data_source == "CSV" and path and os.path.exists(path):
+        return scan_csv(path)
+    return _lazy_from_pandas(df)
+
+
+@st.cache_data(show_spinner=False)
+def compute_correlation(df: pd.DataFrame, numeric_cols: list) -> pd.DataFrame:
+    """Correlation matrix via a single BLAS matmul on a contiguous float32 matrix.
+
+    Standardizing the columns and multiplying arr.T @ arr replaces pandas'
+    per-pair correlation loop with one GEMM call. To match df.corr(),
+    all-null columns are excluded before rows with NaNs are dropped, and
+    constant columns end up as NaN rather than a spurious zero.
+    """
+    result = pd.DataFrame(np.nan, index=numeric_cols, columns=numeric_cols)
+    arr = np.ascontiguousarray(df[numeric_cols].to_numpy(dtype=np.float32))
+    keep = ~np.isnan(arr).all(axis=0)
+    kept_cols = [c for c, k in zip(numeric_cols, keep) if k]
+    arr = arr[:, keep]
+    arr = arr[~np.isnan(arr).any(axis=1)]
+    if len(arr) == 0:
+        return result
+    arr = arr - arr.mean(axis=0)
+    std = arr.std(axis=0)
+    constant = std == 0
+    std[constant] = 1.0
+    arr /= std
+    corr = (arr.T @ arr) / len(arr)
+    corr[constant, :] = np.nan
+    corr[:, constant] = np.nan
+    result.loc[kept_cols, kept_cols] = corr
+    return result
+
+
+def summary_box_trace(values: np.ndarray, name: str) -> go.Box:
+    """Build a box trace from precomputed quartiles and fences.
+
+    The figure carries five numbers per group instead of every raw value.
+    Returns None when the values are all missing.
+    """
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return None
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    in_fence = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    return go.Box(
+        q1=[q1],
+        median=[median],
+        q3=[q3],
+        lowerfence=[in_fence.min()],
+        upperfence=[in_fence.max()],
+        mean=[values.mean()],
+        name=name
+    )
+
+
 def validate_dataframe(df: pd.DataFrame) -> bool:
     """Validate that DataFrame is suitable for visualization."""
     if df is None or df.empty:
@@ -78,14 +350,36 @@ def validate_dataframe(df: pd.DataFrame) -> bool:
     return True
 
 
+@st.cache_data(show_spinner=False)
 def get_numeric_columns(df: pd.DataFrame) -> list:
-    """Get list of numeric columns from DataFrame."""
-    return df.select_dtypes(include=['int64', 'float64', 'int32', 'float32']).columns.tolist()
+    """Get list of numeric columns from DataFrame (NumPy- or Arrow-backed)."""
+    return [
+        c for c in df.columns
+        if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])
+    ]
 
 
+@st.cache_data(show_spinner=False)
 def get_categorical_columns(df: pd.DataFrame) -> list:
-    """Get list of categorical columns from DataFrame."""
-    return df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+    """Get list of categorical columns from DataFrame (NumPy- or Arrow-backed)."""
+    return [
+        c for c in df.columns
+        if pd.api.types.is_string_dtype(df[c])
+        or isinstance(df[c].dtype, pd.CategoricalDtype)
+        or df[c].dtype == object
+    ]
+
+
+@st.fragment
+def dataset_info() -> None:
+    """Sidebar dataset-info block, scoped so chart interactions don't rerun it."""
+    st.subheader(":material/info: Dataset Info")
+    n_rows, n_cols = st.session_state.df_shape or st.session_state.df.shape
+    st.metric("Rows", n_rows)
+    st.metric("Columns", n_cols)
+
+    if st.session_state.uploaded_filename:
+        st.caption(f"File: {st.session_state.uploaded_filename}")
 
 
 # Sidebar - Data Source Selection
@@ -110,11 +404,14 @@ with st.sidebar:
         
         if uploaded_file is not None:
             with st.spinner("Loading data..."):
-                df = load_csv(uploaded_file)
+                csv_path = persist_csv(uploaded_file)
+                df = load_csv(csv_path)
                 if df is not None:
                     st.session_state.df = df
                     st.session_state.data_source = "CSV"
+                    st.session_state.csv_path = csv_path
                     st.session_state.uploaded_filename = uploaded_file.name
+                    st.session_state.df_shape = df.shape
                     st.success(f":material/check_circle: Loaded {len(df)} rows")
     
     # Snowflake
@@ -134,6 +431,7 @@ with st.sidebar:
                 if df is not None:
                     st.session_state.df = df
                     st.session_state.data_source = "Snowflake"
+                    st.session_state.df_shape = df.shape
                     st.success(f":material/check_circle: Loaded {len(df)} rows")
     
     # API
@@ -148,22 +446,18 @@ with st.sidebar:
         
         if st.button(":material/refresh: Fetch Data", use_container_width=True):
             with st.spinner("Fetching data..."):
-                df = fetch_api_data(api_endpoint)
+                df = get_api_data(api_endpoint)
                 if df is not None:
                     st.session_state.df = df
                     st.session_state.data_source = "API"
+                    st.session_state.df_shape = df.shape
                     st.success(f":material/check_circle: Loaded {len(df)} rows")
     
     st.divider()
     
     # Data info
     if st.session_state.df is not None:
-        st.subheader(":material/info: Dataset Info")
-        st.metric("Rows", len(st.session_state.df))
-        st.metric("Columns", len(st.session_state.df.columns))
-        
-        if st.session_state.uploaded_filename:
-            st.caption(f"File: {st.session_state.uploaded_filename}")
+        dataset_info()
 
 
 # Main content
@@ -196,23 +490,38 @@ if df is None:
 if not validate_dataframe(df):
     st.stop()
 
-# Tabs for different views
-tab1, tab2, tab3, tab4 = st.tabs([
-    ":material/table_chart: Data",
-    ":material/bar_chart: Charts",
-    ":material/analytics: Statistics",
-    ":material/download: Export"
-])
+# Partition columns once per loaded frame and keep the result in session
+# state; the id check invalidates the cache when new data is loaded
+cols_cache = st.session_state.get("cols_cache")
+if cols_cache is None or cols_cache["id"] != id(df):
+    cols_cache = {
+        "id": id(df),
+        "numeric": get_numeric_columns(df),
+        "categorical": get_categorical_columns(df),
+        "all": df.columns.tolist(),
+    }
+    st.session_state.cols_cache = cols_cache
 
-with tab1:
+# Each tab renders inside its own fragment, so a widget interaction in one
+# tab only reruns that tab instead of the whole script
+
+
+@st.fragment
+def render_data_tab(df: pd.DataFrame, cols: dict) -> None:
+    """Tab 1: preview grid and quick stats."""
     st.subheader(":material/table_chart: Data Preview")
-    
-    # Column configuration for better display
+
+    # Only ship the first rows to the browser — the grid shows ~20 at a time,
+    # but st.dataframe serializes whatever frame it is given
+    preview_rows = st.number_input("Preview rows", 100, 5000, 500, step=100)
+    preview = df.head(preview_rows) if len(df) > preview_rows else df
     st.dataframe(
-        df,
+        preview,
         height=400,
         use_container_width=True
     )
+    if len(df) > preview_rows:
+        st.caption(f"Showing first {preview_rows:,} of {len(df):,} rows")
     
     # Quick stats
     col1, col2, col3, col4 = st.columns(4)
@@ -221,19 +530,20 @@ with tab1:
     with col2:
         st.metric("Total Columns", len(df.columns))
     with col3:
-        numeric_cols = get_numeric_columns(df)
-        st.metric("Numeric Columns", len(numeric_cols))
+        st.metric("Numeric Columns", len(cols["numeric"]))
     with col4:
-        categorical_cols = get_categorical_columns(df)
-        st.metric("Categorical Columns", len(categorical_cols))
+        st.metric("Categorical Columns", len(cols["categorical"]))
 
-with tab2:
+
+@st.fragment
+def render_charts_tab(df: pd.DataFrame, cols: dict) -> None:
+    """Tab 2: interactive chart builder."""
     st.subheader(":material/bar_chart: Visualizations")
-    
-    numeric_cols = get_numeric_columns(df)
-    categorical_cols = get_categorical_columns(df)
-    all_cols = df.columns.tolist()
-    
+
+    numeric_cols = cols["numeric"]
+    categorical_cols = cols["categorical"]
+    all_cols = cols["all"]
+
     if len(numeric_cols) == 0:
         st.warning("No numeric columns found for visualization")
         st.stop()
@@ -246,6 +556,15 @@ with tab2:
             "Chart Type",
             ["Bar Chart", "Line Chart", "Scatter Plot", "Box Plot", "Histogram"]
         )
+
+        max_points = st.slider(
+            "Plot sample size",
+            min_value=1_000,
+            max_value=200_000,
+            value=50_000,
+            step=1_000,
+            help="Frames larger than this are randomly sampled before plotting"
+        )
     
     with col2:
         # Dynamic options based on chart type
@@ -268,22 +587,75 @@ with tab2:
             col_x = st.selectbox("Column", numeric_cols, key="hist_x")
             col_color = st.selectbox("Color by (optional)", [None] + categorical_cols, key="hist_color")
     
+    # Sample large frames before plotting — Plotly serializes every row into
+    # the figure JSON, so cap the payload at the requested sample size
+    if len(df) > max_points:
+        plot_df = df.sample(max_points, random_state=0)
+        st.caption(f"Plotting a random sample of {max_points:,} of {len(df):,} rows")
+    else:
+        plot_df = df
+
     # Generate chart
     try:
         if chart_type == "Bar Chart":
-            fig = px.bar(df, x=col_x, y=col_y, color=col_color)
-            
+            fig = px.bar(plot_df, x=col_x, y=col_y, color=col_color)
+
         elif chart_type == "Line Chart":
-            fig = px.line(df, x=col_x, y=col_y, color=col_color, markers=True)
-            
+            fig = px.line(plot_df, x=col_x, y=col_y, color=col_color, markers=True)
+
         elif chart_type == "Scatter Plot":
-            fig = px.scatter(df, x=col_x, y=col_y, color=col_color)
-            
+            # Scattergl renders via WebGL and takes NumPy arrays directly,
+            # skipping the px DataFrame-to-dict conversion
+            fig = go.Figure()
+            if col_color:
+                for name, group in plot_df.groupby(col_color, observed=True):
+                    fig.add_trace(go.Scattergl(
+                        x=group[col_x].to_numpy(),
+                        y=group[col_y].to_numpy(),
+                        mode='markers',
+                        name=str(name)
+                    ))
+            else:
+                fig.add_trace(go.Scattergl(
+                    x=plot_df[col_x].to_numpy(),
+                    y=plot_df[col_y].to_numpy(),
+                    mode='markers'
+                ))
+            fig.update_layout(xaxis_title=col_x, yaxis_title=col_y)
+
         elif chart_type == "Box Plot":
-            fig = px.box(df, x=col_x, y=col_y)
-            
+            # Ship the five-number summary per group instead of raw values
+            fig = go.Figure()
+            if col_x:
+                for name, group in plot_df.groupby(col_x, observed=True):
+                    trace = summary_box_trace(group[col_y].to_numpy(dtype=float), str(name))
+                    if trace is not None:
+                        fig.add_trace(trace)
+            else:
+                trace = summary_box_trace(plot_df[col_y].to_numpy(dtype=float), col_y)
+                if trace is not None:
+                    fig.add_trace(trace)
+            fig.update_layout(yaxis_title=col_y, showlegend=col_x is not None)
+
         elif chart_type == "Histogram":
-            fig = px.histogram(df, x=col_x, color=col_color)
+            # Bin server-side with shared edges — O(bins) bars per group
+            # instead of shipping every value to the browser
+            values = plot_df[col_x].to_numpy(dtype=float)
+            values = values[~np.isnan(values)]
+            edges = np.histogram_bin_edges(values, bins='auto')
+            centers = (edges[:-1] + edges[1:]) / 2
+
+            fig = go.Figure()
+            if col_color:
+                for name, group in plot_df.groupby(col_color, observed=True):
+                    group_values = group[col_x].to_numpy(dtype=float)
+                    counts, _ = np.histogram(group_values[~np.isnan(group_values)], edges)
+                    fig.add_trace(go.Bar(x=centers, y=counts, name=str(name)))
+                fig.update_layout(barmode='stack')
+            else:
+                counts, _ = np.histogram(values, edges)
+                fig.add_trace(go.Bar(x=centers, y=counts))
+            fig.update_layout(xaxis_title=col_x, yaxis_title='count', bargap=0)
         
         # Update layout
         fig.update_layout(
@@ -296,23 +668,27 @@ with tab2:
     except Exception as e:
         st.error(f"Error generating chart: {e}")
 
-with tab3:
+
+@st.fragment
+def render_stats_tab(df: pd.DataFrame, cols: dict) -> None:
+    """Tab 3: descriptive statistics, correlation, and missing values."""
     st.subheader(":material/analytics: Statistical Summary")
-    
-    numeric_cols = get_numeric_columns(df)
-    
+
+    numeric_cols = cols["numeric"]
+
     if len(numeric_cols) > 0:
-        # Summary statistics
+        # Summary statistics (single optimized Polars pass over the numeric columns)
         st.write("**Descriptive Statistics**")
-        st.dataframe(df[numeric_cols].describe(), use_container_width=True)
-        
+        stats = to_lazy(df).select(numeric_cols).collect(engine="streaming").describe()
+        st.dataframe(stats, use_container_width=True)
+
         st.divider()
-        
+
         # Correlation matrix
         if len(numeric_cols) > 1:
             st.write("**Correlation Matrix**")
-            corr_matrix = df[numeric_cols].corr()
-            
+            corr_matrix = compute_correlation(df, numeric_cols)
+
             fig = px.imshow(
                 corr_matrix,
                 text_auto=True,
@@ -326,32 +702,37 @@ with tab3:
     else:
         st.info("No numeric columns available for statistical analysis")
     
-    # Missing values
+    # Missing values (one vectorized reduction over the isna mask)
     st.divider()
     st.write("**Missing Values**")
-    missing = df.isnull().sum()
+    na_counts = df.isna().to_numpy().sum(axis=0)
     missing_df = pd.DataFrame({
-        'Column': missing.index,
-        'Missing Count': missing.values,
-        'Percentage': (missing.values / len(df) * 100).round(2)
+        'Column': df.columns,
+        'Missing Count': na_counts,
+        'Percentage': (na_counts * (100.0 / len(df))).round(2)
     })
-    missing_df = missing_df[missing_df['Missing Count'] > 0]
+    missing_df = missing_df[na_counts > 0]
     
     if len(missing_df) > 0:
         st.dataframe(missing_df, use_container_width=True)
     else:
         st.success(":material/check_circle: No missing values found!")
 
-with tab4:
+
+@st.fragment
+def render_export_tab(df: pd.DataFrame, cols: dict) -> None:
+    """Tab 4: CSV/Excel downloads and filtered export."""
     st.subheader(":material/download: Export Data")
-    
+
+    categorical_cols = cols["categorical"]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        # CSV export
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        csv = df.to_csv(index=False)
-        
+        # CSV export (serialized once per frame via cache)
+        csv = build_csv(df)
+
         st.download_button(
             label=":material/download: Download as CSV",
             data=csv,
@@ -361,21 +742,20 @@ with tab4:
         )
     
     with col2:
-        # Excel export
-        import io
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Data', index=False)
-            if len(get_numeric_columns(df)) > 0:
-                df[get_numeric_columns(df)].describe().to_excel(writer, sheet_name='Statistics')
-        
-        st.download_button(
-            label=":material/download: Download as Excel",
-            data=output.getvalue(),
-            file_name=f"dashboard_export_{timestamp}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
-        )
+        # Excel export — the workbook is only built on demand, not on every
+        # rerun of the tab
+        if st.button(":material/table_view: Prepare Excel", use_container_width=True):
+            st.session_state.xlsx_bytes = (id(df), build_xlsx(df))
+
+        xlsx = st.session_state.xlsx_bytes
+        if xlsx is not None and xlsx[0] == id(df):
+            st.download_button(
+                label=":material/download: Download as Excel",
+                data=xlsx[1],
+                file_name=f"dashboard_export_{timestamp}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
     
     st.divider()
     
@@ -383,16 +763,25 @@ with tab4:
     with st.expander("Export Options"):
         st.write("**Filter data before export:**")
         
-        if len(get_categorical_columns(df)) > 0:
-            filter_col = st.selectbox("Filter by column", get_categorical_columns(df))
-            unique_values = df[filter_col].unique().tolist()
+        if len(categorical_cols) > 0:
+            filter_col = st.selectbox("Filter by column", categorical_cols)
+            filter_series = df[filter_col]
+            if isinstance(filter_series.dtype, pd.CategoricalDtype):
+                # Already materialized in the dtype — O(categories), not O(rows)
+                unique_values = filter_series.cat.categories.tolist()
+            else:
+                unique_values = filter_series.unique().tolist()
             selected_values = st.multiselect(f"Select {filter_col} values", unique_values)
             
             if selected_values:
-                filtered_df = df[df[filter_col].isin(selected_values)]
-                st.metric("Filtered Rows", len(filtered_df))
-                
-                csv_filtered = filtered_df.to_csv(index=False)
+                filtered_df = (
+                    to_lazy(df)
+                    .filter(pl.col(filter_col).is_in(selected_values))
+                    .collect(engine="streaming")
+                )
+                st.metric("Filtered Rows", filtered_df.height)
+
+                csv_filtered = filtered_df.write_csv()
                 st.download_button(
                     label=":material/download: Download Filtered CSV",
                     data=csv_filtered,
@@ -401,6 +790,27 @@ with tab4:
                     use_container_width=True
                 )
 
+
+# Tabs for different views
+tab1, tab2, tab3, tab4 = st.tabs([
+    ":material/table_chart: Data",
+    ":material/bar_chart: Charts",
+    ":material/analytics: Statistics",
+    ":material/download: Export"
+])
+
+with tab1:
+    render_data_tab(df, cols_cache)
+
+with tab2:
+    render_charts_tab(df, cols_cache)
+
+with tab3:
+    render_stats_tab(df, cols_cache)
+
+with tab4:
+    render_export_tab(df, cols_cache)
+
 # Footer
 st.divider()
 st.caption(f"Dashboard powered by Streamlit | Data source: {st.session_state.data_source}")